@@ -48,6 +48,9 @@
         pythonEnv = python.withPackages (ps: with ps; [
           flask
           flask-cors
+          gunicorn
+          gevent
+          orjson
           pillow
           requests
           faker
@@ -107,7 +110,7 @@ EOF
           # Create Procfile for local development
           cat > Procfile.local << 'EOF'
 web: npm run dev
-mock: python scripts/mock-services.py
+mock: gunicorn -k gevent --worker-connections 1000 -b 0.0.0.0:8080 --chdir scripts mock-services:app
 EOF
           
           echo "✅ Local environment setup complete!"
@@ -4,18 +4,38 @@ TShop Mock Services Server
 Provides mock API endpoints for local development without external dependencies
 """
 
-import json
+import atexit
+import contextlib
+import hashlib
+import itertools
+import os
 import random
+import re
+import stat
+import sys
+import tempfile
+import threading
 import time
 import io
 import base64
+import zlib
+from collections import deque
 from datetime import datetime
-from flask import Flask, request, jsonify, send_file
-from flask_cors import CORS
+from functools import lru_cache
+import orjson
+from flask import Flask, Response, abort, request, send_from_directory
 from PIL import Image, ImageDraw, ImageFont
+from werkzeug.exceptions import NotFound
 
 app = Flask(__name__)
-CORS(app)
+
+@app.after_request
+def _cors(response):
+    """Allow any origin, the mock services are only called from dev frontends"""
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    response.headers['Access-Control-Allow-Headers'] = '*'
+    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+    return response
 
 # Mock design templates
 DESIGN_TEMPLATES = [
@@ -25,99 +45,279 @@ DESIGN_TEMPLATES = [
     {"category": "pattern", "style": "abstract", "colors": ["#FF6B6B", "#4ECDC4", "#45B7D1"]},
 ]
 
-def generate_mock_design_image(prompt, product_type="tshirt", width=400, height=400):
-    """Generate a simple mock design image using PIL"""
+# Pre-drawn random values, routes read the next slot instead of calling the PRNG
+_RANDOM_POOL_MASK = (1 << 16) - 1
+_RANDOM_FLOATS = [random.random() for _ in range(_RANDOM_POOL_MASK + 1)]
+_RANDOM_INTS = [random.randint(1000000, 9999999) for _ in range(_RANDOM_POOL_MASK + 1)]
+_random_index = itertools.count()
+
+def _uniform(low, high):
+    """Pooled equivalent of random.uniform"""
+    return low + (high - low) * _RANDOM_FLOATS[next(_random_index) & _RANDOM_POOL_MASK]
+
+def _choice(seq):
+    """Pooled equivalent of random.choice"""
+    return seq[int(len(seq) * _RANDOM_FLOATS[next(_random_index) & _RANDOM_POOL_MASK])]
+
+def _order_number():
+    """Pooled seven digit order number"""
+    return _RANDOM_INTS[next(_random_index) & _RANDOM_POOL_MASK]
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+# Load the design font once, fallback to default if not available
+try:
+    _FONT = ImageFont.truetype(FONT_PATH, 24)
+except OSError:
+    _FONT = ImageFont.load_default()
+
+@lru_cache(maxsize=1024)
+def _text_width(text):
+    """Rendered width of text in the design font"""
+    bbox = _FONT.getbbox(text)
+    return bbox[2] - bbox[0]
+
+# Shape drawn behind the prompt for each product type, t-shirt is the default
+PRODUCT_SHAPES = {
+    'tshirt': ('ellipse', (100, 100, 300, 300)),  # Circular design for t-shirts
+    'cap': ('ellipse', (50, 100, 350, 300)),  # Curved design for caps
+    'tote_bag': ('rectangle', (50, 50, 350, 350)),  # Rectangular design for tote bags
+}
+
+@lru_cache(maxsize=64)
+def _base_image(product_type, bg_color, width, height):
+    """Render the static parts of a design for a product type.
+
+    The background, product shape and product label only depend on the
+    product type, colour and size, so they are drawn once and callers overlay
+    the prompt text on a copy.
+    """
+    img = Image.new('RGB', (width, height), color='white')
+    draw = ImageDraw.Draw(img)
+
+    shape, box = PRODUCT_SHAPES.get(product_type, PRODUCT_SHAPES['tshirt'])
+    getattr(draw, shape)(box, fill=bg_color)
+
+    # Add product type indicator
+    draw.text((10, 10), f"Mock {product_type.replace('_', ' ').title()}",
+              fill="#666666", font=_FONT)
+
+    return img
+
+# Encoder settings per served image format
+IMAGE_FORMATS = {
+    'image/png': ('PNG', 'png', {'compress_level': 1}),
+    'image/jpeg': ('JPEG', 'jpg', {'quality': 80}),
+}
+
+def generate_mock_design_image(prompt, product_type="tshirt", width=400, height=400,
+                               mimetype='image/png'):
+    """Generate a simple mock design image using PIL, returns the encoded bytes"""
     try:
-        # Create a new image with white background
-        img = Image.new('RGB', (width, height), color='white')
-        draw = ImageDraw.Draw(img)
-        
-        # Try to use a basic font, fallback to default if not available
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-        except:
-            font = ImageFont.load_default()
-        
-        # Choose random colors based on prompt
-        template = random.choice(DESIGN_TEMPLATES)
-        bg_color = random.choice(template["colors"])
-        text_color = "#FFFFFF" if bg_color == "#000000" else "#000000"
-        
-        # Create design based on product type
-        if product_type == "cap":
-            # Draw a curved design for caps
-            draw.ellipse([50, 100, 350, 300], fill=bg_color)
-            text_y = 180
-        elif product_type == "tote_bag":
-            # Draw a rectangular design for tote bags
-            draw.rectangle([50, 50, 350, 350], fill=bg_color)
-            text_y = 180
-        else:  # t-shirt default
-            # Draw a circular design for t-shirts
-            draw.ellipse([100, 100, 300, 300], fill=bg_color)
-            text_y = 180
-        
-        # Add prompt text
-        prompt_short = prompt[:20] + "..." if len(prompt) > 20 else prompt
-        
-        # Calculate text position to center it
-        bbox = draw.textbbox((0, 0), prompt_short, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_x = (width - text_width) // 2
-        
-        draw.text((text_x, text_y), prompt_short, fill=text_color, font=font)
-        
-        # Add product type indicator
-        draw.text((10, 10), f"Mock {product_type.replace('_', ' ').title()}", 
-                 fill="#666666", font=font)
-        
-        # Save to bytes
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-        
-        return img_buffer
+        return _render_design(_shorten_prompt(prompt), product_type, width, height, mimetype)
     except Exception as e:
         print(f"Error generating image: {e}")
-        # Return a simple colored rectangle as fallback
-        img = Image.new('RGB', (width, height), color='#CCCCCC')
-        draw = ImageDraw.Draw(img)
-        draw.text((50, height//2), "Mock Design", fill="#000000")
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-        return img_buffer
+        return _fallback_design(width, height, mimetype)
+
+def _shorten_prompt(prompt):
+    """Prompt text as drawn on the design, which is all a render depends on"""
+    return prompt[:20] + "..." if len(prompt) > 20 else prompt
+
+@lru_cache(maxsize=256)
+def _render_design(prompt_short, product_type, width, height, mimetype):
+    """Render and encode a design, cached so repeated prompts skip PIL entirely.
+
+    Raises on failure, so errors are never memoised or written to the image
+    cache directory.
+    """
+    image_format, _, save_options = IMAGE_FORMATS[mimetype]
+    
+    # Choose colors based on prompt, stable across requests and restarts
+    seed = zlib.crc32(prompt_short.encode())
+    template = DESIGN_TEMPLATES[seed % len(DESIGN_TEMPLATES)]
+    bg_color = template["colors"][seed // len(DESIGN_TEMPLATES) % len(template["colors"])]
+    text_color = "#FFFFFF" if bg_color == "#000000" else "#000000"
+    
+    # Start from the cached background, shape and label
+    img = _base_image(product_type, bg_color, width, height).copy()
+    draw = ImageDraw.Draw(img)
+    text_y = 180
+    
+    # Calculate text position to center it
+    text_x = (width - _text_width(prompt_short)) // 2
+    
+    draw.text((text_x, text_y), prompt_short, fill=text_color, font=_FONT)
+    
+    # Save to bytes
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, format=image_format, **save_options)
+    
+    return img_buffer.getvalue()
+
+def _fallback_design(width, height, mimetype):
+    """Return a simple colored rectangle when a design can't be rendered"""
+    image_format, _, save_options = IMAGE_FORMATS[mimetype]
+    img = Image.new('RGB', (width, height), color='#CCCCCC')
+    draw = ImageDraw.Draw(img)
+    draw.text((50, height//2), "Mock Design", fill="#000000")
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, format=image_format, **save_options)
+    return img_buffer.getvalue()
+
+# Draw every product base image in every template colour at startup so shape
+# fills never run on the request path, then pre-render the default design
+for _product_type in PRODUCT_SHAPES:
+    for _template in DESIGN_TEMPLATES:
+        for _color in _template["colors"]:
+            _base_image(_product_type, _color, 400, 400)
+    generate_mock_design_image('Mock Design', _product_type)
+
+# Cached files are keyed on this script's source so editing it invalidates them
+with open(__file__, 'rb') as _source:
+    _RENDER_VERSION = hashlib.sha1(_source.read()).hexdigest()[:12]
+
+# Upper bound on cached design files, about 10 KB each
+IMAGE_CACHE_MAX_FILES = 512
+
+# Names of the files _design_image_file writes, including in-progress temp files
+_CACHE_FILE_RE = re.compile(r'design_([0-9a-f]{12})_[0-9a-f]{40}\.(?:png|jpg)(?:\.\d+\.\d+\.tmp)?')
+
+def _open_image_cache():
+    """Prepare the per-user design image cache directory.
+
+    Rendered designs are written here so the route can serve them as files,
+    which gunicorn sends with sendfile(2). /dev/shm keeps them in memory on
+    Linux. In the default directory, design files left by other versions of
+    this script are removed; a MOCK_IMAGE_CACHE_DIR is never cleaned up.
+    Returns None when the directory can't be used safely, images are then
+    served from memory.
+    """
+    custom_path = os.environ.get('MOCK_IMAGE_CACHE_DIR')
+    path = custom_path or os.path.join(
+        '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir(),
+        f'tshop-{os.getuid()}')
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        # Refuse a directory another user created or can write to
+        info = os.lstat(path)
+        if (not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid()
+                or info.st_mode & 0o022):
+            print(f"Image cache {path} is not a private directory, serving from memory")
+            return None
+        if not custom_path:
+            for name in os.listdir(path):
+                match = _CACHE_FILE_RE.fullmatch(name)
+                if match and match.group(1) != _RENDER_VERSION:
+                    with contextlib.suppress(OSError):
+                        os.remove(os.path.join(path, name))
+    except OSError as e:
+        print(f"Image cache {path} unavailable, serving from memory: {e}")
+        return None
+    return path
+
+IMAGE_CACHE_DIR = _open_image_cache()
+
+def _design_image_file(prompt, product_type, mimetype):
+    """Write a design to the image cache directory if missing.
+
+    Returns the file name, or None if the design should be served from memory
+    because the cache is unavailable, full, failed to write or the design
+    failed to render.
+    """
+    if IMAGE_CACHE_DIR is None:
+        return None
+    key = hashlib.sha1(f'{_shorten_prompt(prompt)}\0{product_type}'.encode()).hexdigest()
+    filename = f'design_{_RENDER_VERSION}_{key}.{IMAGE_FORMATS[mimetype][1]}'
+    path = os.path.join(IMAGE_CACHE_DIR, filename)
+    if os.path.exists(path):
+        return filename
+    try:
+        if len(os.listdir(IMAGE_CACHE_DIR)) >= IMAGE_CACHE_MAX_FILES:
+            return None
+        try:
+            image_bytes = _render_design(_shorten_prompt(prompt), product_type,
+                                         400, 400, mimetype)
+        except Exception:
+            # Let the caller serve the fallback without caching it
+            return None
+        # Write then rename so concurrent workers never serve a partial file
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(image_bytes)
+            os.replace(tmp_path, path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+    except OSError as e:
+        print(f"Error caching image: {e}")
+        return None
+    return filename
+
+# Monotonic ID sequences, seeded with the start time and worker pid so IDs stay
+# unique across concurrent requests, gunicorn workers and restarts
+_ID_SEED = (os.getpid() << 52) | (int(time.time()) << 20)
+_design_ids = itertools.count(_ID_SEED)
+_order_ids = itertools.count(_ID_SEED)
+
+# (second, ISO timestamp) of the last formatted time, shared by all routes
+_timestamp = (0, '')
+
+def _now_iso():
+    """Current local time as ISO 8601, formatted at most once per second"""
+    global _timestamp
+    second = int(time.time())
+    if _timestamp[0] != second:
+        _timestamp = (second, datetime.fromtimestamp(second).isoformat())
+    return _timestamp[1]
+
+def _request_json():
+    """Parse the request body with orjson, an empty body parses as {}"""
+    body = request.get_data(cache=False)
+    if not body:
+        return {}
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        abort(400, description='Invalid JSON body')
+
+def _json_response(obj):
+    """Serialize a response body with orjson"""
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
+# Static parts of the /health body, only the timestamp varies per request
+_HEALTH_JSON_PREFIX = b'{"status":"healthy","timestamp":'
+_HEALTH_JSON_SUFFIX = b',"services":["ai_generation","image_processing","fulfillment"]}'
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'services': ['ai_generation', 'image_processing', 'fulfillment']
-    })
+    timestamp = orjson.dumps(_now_iso())
+    return Response(_HEALTH_JSON_PREFIX + timestamp + _HEALTH_JSON_SUFFIX,
+                    mimetype='application/json')
 
 @app.route('/ai/generate-design', methods=['POST'])
 def generate_design():
     """Mock AI design generation endpoint"""
-    data = request.json
+    data = _request_json()
     prompt = data.get('prompt', 'Default design')
     product_type = data.get('product_type', 'tshirt')
     
-    # Simulate AI processing time
-    processing_time = random.uniform(0.5, 2.0)
+    # Simulate AI processing time, gunicorn's gevent worker makes the sleep
+    # yield to other requests instead of holding a thread
+    processing_time = _uniform(0.5, 2.0)
     time.sleep(processing_time)
     
-    design_id = f'mock_design_{int(time.time())}'
+    design_id = f'mock_design_{next(_design_ids)}'
     
-    return jsonify({
+    return _json_response({
         'success': True,
         'design_id': design_id,
         'design_url': f'/api/mock-design-image?prompt={prompt}&product_type={product_type}&id={design_id}',
         'prompt_used': prompt,
         'product_type': product_type,
         'processing_time': processing_time,
-        'style_notes': f'Generated {random.choice(DESIGN_TEMPLATES)["style"]} style design',
+        'style_notes': f'Generated {_choice(DESIGN_TEMPLATES)["style"]} style design',
         'recommendations': [
             f'Works well on {product_type}',
             'Consider trying different colors',
@@ -132,42 +332,71 @@ def mock_design_image():
     product_type = request.args.get('product_type', 'tshirt')
     design_id = request.args.get('id', 'default')
     
-    # Generate the image
-    img_buffer = generate_mock_design_image(prompt, product_type)
+    # Serve JPEG only to clients that prefer it, PNG stays the default
+    mimetype = 'image/jpeg' if request.accept_mimetypes.best_match(
+        ['image/png', 'image/jpeg']) == 'image/jpeg' else 'image/png'
+    extension = IMAGE_FORMATS[mimetype][1]
+    
+    # Generate the image, or reuse the cached file
+    filename = _design_image_file(prompt, product_type, mimetype)
+    response = None
     
-    return send_file(
-        img_buffer,
-        mimetype='image/png',
-        as_attachment=False,
-        download_name=f'design_{design_id}.png'
-    )
+    if filename is not None:
+        try:
+            response = send_from_directory(
+                IMAGE_CACHE_DIR,
+                filename,
+                mimetype=mimetype,
+                download_name=f'design_{design_id}.{extension}',
+                max_age=86400
+            )
+        except NotFound:
+            # A worker running a newer version of this script removed the file
+            pass
+    
+    if response is None:
+        try:
+            image_bytes = _render_design(_shorten_prompt(prompt), product_type,
+                                         400, 400, mimetype)
+            cache_control = 'public, max-age=86400'
+        except Exception as e:
+            print(f"Error generating image: {e}")
+            # The placeholder must not be cached in place of the real design
+            image_bytes = _fallback_design(400, 400, mimetype)
+            cache_control = 'no-store'
+        response = Response(image_bytes, mimetype=mimetype)
+        response.headers.set('Content-Disposition', 'inline',
+                             filename=f'design_{design_id}.{extension}')
+        response.headers['Cache-Control'] = cache_control
+    response.vary.add('Accept')
+    return response
 
 @app.route('/images/process', methods=['POST'])
 def process_image():
     """Mock image processing endpoint"""
-    data = request.json
+    data = _request_json()
     image_url = data.get('image_url', '')
     operations = data.get('operations', [])
     
-    # Simulate processing time
-    time.sleep(random.uniform(0.2, 1.0))
+    # Simulate processing time (cooperative under the gevent worker)
+    time.sleep(_uniform(0.2, 1.0))
     
-    return jsonify({
+    return _json_response({
         'success': True,
         'processed_url': f'/api/processed-image?original={image_url}',
         'operations_applied': operations,
-        'processing_time': random.uniform(0.2, 1.0)
+        'processing_time': _uniform(0.2, 1.0)
     })
 
 @app.route('/webhooks/stripe', methods=['POST'])
 def stripe_webhook():
     """Mock Stripe webhook endpoint"""
-    data = request.json
+    data = _request_json()
     event_type = data.get('type', 'payment_intent.succeeded')
     
     print(f"📦 Mock Stripe webhook received: {event_type}")
     
-    return jsonify({
+    return _json_response({
         'success': True,
         'processed': True,
         'event_type': event_type
@@ -176,17 +405,17 @@ def stripe_webhook():
 @app.route('/fulfillment/printful/orders', methods=['POST'])
 def create_printful_order():
     """Mock Printful order creation"""
-    data = request.json
+    data = _request_json()
     
     mock_order = {
-        'id': random.randint(1000000, 9999999),
-        'external_id': data.get('external_id', f'tshop_{int(time.time())}'),
+        'id': _order_number(),
+        'external_id': data.get('external_id', f'tshop_{next(_order_ids)}'),
         'status': 'draft',
-        'created': datetime.now().isoformat(),
+        'created': _now_iso(),
         'items': data.get('items', [])
     }
     
-    return jsonify({
+    return _json_response({
         'code': 200,
         'result': mock_order
     })
@@ -194,64 +423,103 @@ def create_printful_order():
 @app.route('/fulfillment/printify/orders', methods=['POST'])
 def create_printify_order():
     """Mock Printify order creation"""
-    data = request.json
+    data = _request_json()
     
     mock_order = {
-        'id': f'pf_{random.randint(1000000, 9999999)}',
+        'id': f'pf_{_order_number()}',
         'status': 'pending',
-        'created_at': datetime.now().isoformat(),
+        'created_at': _now_iso(),
         'line_items': data.get('line_items', [])
     }
     
-    return jsonify(mock_order)
+    return _json_response(mock_order)
+
+# Mock product catalog shared by all fulfillment providers
+MOCK_PRODUCTS = {
+    'tshirts': [
+        {'id': 1, 'name': 'Unisex T-Shirt', 'colors': ['white', 'black', 'navy']},
+        {'id': 2, 'name': 'Premium T-Shirt', 'colors': ['white', 'black', 'gray']}
+    ],
+    'caps': [
+        {'id': 10, 'name': 'Classic Cap', 'colors': ['black', 'navy', 'white']},
+        {'id': 11, 'name': 'Snapback', 'colors': ['black', 'red', 'blue']}
+    ],
+    'tote_bags': [
+        {'id': 20, 'name': 'Canvas Tote', 'colors': ['natural', 'black']},
+        {'id': 21, 'name': 'Premium Tote', 'colors': ['white', 'navy', 'gray']}
+    ]
+}
+
+# The catalog body is serialized once, split around the provider field
+_PRODUCTS_JSON_PREFIX = b'{"success":true,"provider":'
+_PRODUCTS_JSON_SUFFIX = b',"products":' + orjson.dumps(MOCK_PRODUCTS) + b'}'
 
 @app.route('/fulfillment/<provider>/products')
 def get_products(provider):
     """Mock product catalog for fulfillment providers"""
-    mock_products = {
-        'tshirts': [
-            {'id': 1, 'name': 'Unisex T-Shirt', 'colors': ['white', 'black', 'navy']},
-            {'id': 2, 'name': 'Premium T-Shirt', 'colors': ['white', 'black', 'gray']}
-        ],
-        'caps': [
-            {'id': 10, 'name': 'Classic Cap', 'colors': ['black', 'navy', 'white']},
-            {'id': 11, 'name': 'Snapback', 'colors': ['black', 'red', 'blue']}
-        ],
-        'tote_bags': [
-            {'id': 20, 'name': 'Canvas Tote', 'colors': ['natural', 'black']},
-            {'id': 21, 'name': 'Premium Tote', 'colors': ['white', 'navy', 'gray']}
-        ]
-    }
-    
-    return jsonify({
-        'success': True,
-        'provider': provider,
-        'products': mock_products
-    })
+    body = _PRODUCTS_JSON_PREFIX + orjson.dumps(provider) + _PRODUCTS_JSON_SUFFIX
+    return Response(body, mimetype='application/json')
 
 @app.route('/social/share', methods=['POST'])
 def social_share():
     """Mock social sharing endpoint"""
-    data = request.json
+    data = _request_json()
     platform = data.get('platform', 'instagram')
     design_id = data.get('design_id', '')
     
-    return jsonify({
+    return _json_response({
         'success': True,
         'platform': platform,
         'share_url': f'https://tshop.local/designs/{design_id}',
         'message': 'Design shared successfully!'
     })
 
+# Analytics log lines are queued per request and written to stdout in batches
+_analytics_events = deque(maxlen=65536)
+
+def _flush_analytics():
+    """Write all queued analytics lines with a single stdout write"""
+    batch = []
+    while True:
+        # The atexit flush may race the drain thread, so pop until empty
+        try:
+            batch.append(_analytics_events.popleft())
+        except IndexError:
+            break
+    if not batch:
+        return
+    try:
+        sys.stdout.flush()
+        out = getattr(sys.stdout, 'buffer', None)
+        if out is None:
+            sys.stdout.write(b''.join(batch).decode())
+            sys.stdout.flush()
+        else:
+            out.write(b''.join(batch))
+            out.flush()
+    except (OSError, ValueError) as e:
+        # Drop this batch but keep draining, e.g. after a closed pipe
+        with contextlib.suppress(OSError, ValueError):
+            print(f"Error writing analytics: {e}", file=sys.stderr)
+
+def _drain_analytics():
+    """Flush queued analytics lines every 100 ms"""
+    while True:
+        time.sleep(0.1)
+        _flush_analytics()
+
+threading.Thread(target=_drain_analytics, name='analytics-drain', daemon=True).start()
+atexit.register(_flush_analytics)
+
 @app.route('/analytics/track', methods=['POST'])
 def track_analytics():
     """Mock analytics tracking"""
-    data = request.json
+    data = _request_json()
     event = data.get('event', 'page_view')
     
-    print(f"📊 Analytics: {event} - {data}")
+    _analytics_events.append(f"📊 Analytics: {event} - {data}\n".encode())
     
-    return jsonify({
+    return _json_response({
         'success': True,
         'event': event,
         'tracked': True
@@ -269,4 +537,6 @@ if __name__ == '__main__':
     print("=" * 50)
     print()
     
-    app.run(host='0.0.0.0', port=8080, debug=True, use_reloader=False)
+    # Development server only, containers run the app under gunicorn
+    app.run(host='0.0.0.0', port=8080, debug=os.environ.get('FLASK_DEBUG') == '1',
+            use_reloader=False)